@@ -66,15 +66,17 @@ func (c *Client) Remove(ctx context.Context, name string) (bool, error) {
 // Rotate updates the value of an existing secret and increments its version.
 // Returns the new version number. The new value is passed via stdin.
 func (c *Client) Rotate(ctx context.Context, name, newValue string) (int, error) {
-	_, err := c.runCmd(ctx, []string{"rotate", name}, newValue)
+	result, err := c.runCmd(ctx, []string{"rotate", name}, newValue)
 	if err != nil {
 		return 0, err
 	}
-	// The rotate command does not return JSON output with the version,
-	// so we fetch the secret to get the current version.
-	result, err := c.runCmd(ctx, []string{"get", name}, "")
-	if err != nil {
-		return 0, err
+	if result == nil {
+		// Older CLIs print nothing on rotate, so fetch the secret to
+		// get the current version.
+		result, err = c.runCmd(ctx, []string{"get", name}, "")
+		if err != nil {
+			return 0, err
+		}
 	}
 	version, ok := result["version"].(float64)
 	if !ok {
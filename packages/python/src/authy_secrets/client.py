@@ -2,13 +2,340 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 import shutil
 import subprocess
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .errors import (
+    AuthyError,
+    SecretAlreadyExists,
+    SecretNotFound,
+    _map_error,
+    _map_message,
+)
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    # Decode the hot responses straight into structs; unused fields are
+    # skipped by the decoder instead of being materialised in a dict.
+
+    class _GetResponse(msgspec.Struct):
+        value: str
+        version: int
+
+    class _SecretListItem(msgspec.Struct):
+        name: str
+
+    class _ListResponse(msgspec.Struct):
+        secrets: List[_SecretListItem]
+
+    class _ExportEntry(msgspec.Struct):
+        name: str
+        value: str
+
+    _get_decoder = msgspec.json.Decoder(_GetResponse)
+    _list_decoder = msgspec.json.Decoder(_ListResponse)
+    _export_decoder = msgspec.json.Decoder(List[_ExportEntry])
+
+    def _decode_value(raw: bytes) -> str:
+        return _get_decoder.decode(raw).value
+
+    def _decode_names(raw: bytes) -> List[str]:
+        return [s.name for s in _list_decoder.decode(raw).secrets]
+
+    def _decode_values(raw: bytes) -> Dict[str, str]:
+        return {e.name: e.value for e in _export_decoder.decode(raw)}
+
+else:
+    # Field names are looked up with string literals, which the compiler
+    # already interns, and orjson caches parsed keys across calls, so no
+    # sys.intern() is needed on this path. Callers listing very large
+    # vaults should use Authy.iter_list(), which streams from the pipe.
+
+    def _decode_value(raw: bytes) -> str:
+        return _loads(raw)["value"]
+
+    def _decode_names(raw: bytes) -> List[str]:
+        return [s["name"] for s in _loads(raw).get("secrets", [])]
+
+    def _decode_values(raw: bytes) -> Dict[str, str]:
+        return {e["name"]: e["value"] for e in _loads(raw)}
+
+# An empty vault lists as one of these (the CLI prints the compact form);
+# such a response is answered without running a parser.
+_EMPTY_LIST_LITERALS = frozenset((b'{"secrets":[]}', b'{"secrets": []}'))
+
+
+def _decode_list(raw: bytes) -> List[str]:
+    """Decode a ``list`` response into secret names."""
+    # The length check keeps strip() from copying large responses.
+    if len(raw) < 32 and raw.strip() in _EMPTY_LIST_LITERALS:
+        return []
+    return _decode_names(raw)
+
+
+try:
+    import ijson
 
-from .errors import AuthyError, _map_error
+    _StreamError: type = ijson.JSONError
+except ImportError:
+    ijson = None
+    _StreamError = ValueError
+
+
+# (binary, flag) pairs an installed CLI has rejected as unknown, so newer
+# options are tried once per binary and then skipped.
+_UNSUPPORTED_FLAGS: Set[Tuple[str, str]] = set()
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_authy(path_env: Optional[str]) -> Optional[str]:
+    """Locate ``authy`` on PATH; ``shutil.which`` stats every entry.
+
+    Cached per ``PATH`` value (``path_env``), which is also the search path,
+    so a changed PATH is searched again while repeated lookups under the
+    same PATH are free.
+    """
+    return shutil.which("authy", path=path_env)
+
+
+def _binary_path(binary: Optional[str]) -> str:
+    """Resolve ``binary`` (default: ``authy`` on PATH) to the path to execute.
+
+    subprocess spawns with ``posix_spawn`` rather than forking this process
+    only for an executable given with a directory, only with
+    ``close_fds=False``, and only while ``preexec_fn``, ``pass_fds`` and
+    ``cwd`` are left unset. The path is therefore kept absolute, and
+    per-call CLI spawns pass ``close_fds=False`` and none of the others.
+    """
+    if binary is None:
+        found = _resolve_authy(os.environ.get("PATH"))
+        if found is None:
+            raise FileNotFoundError(
+                "authy binary not found on PATH. "
+                "Install authy or pass binary='/path/to/authy'."
+            )
+    elif os.path.dirname(binary):
+        found = binary
+    else:
+        # A bare command name is looked up on PATH up front.
+        found = shutil.which(binary) or binary
+    return os.path.abspath(found) if os.path.dirname(found) else found
+
+
+# The CLI's --json errors have a fixed shape ({"error": {"code", "message",
+# "exit_code"}}), so the two fields needed are pulled out directly instead
+# of running a full JSON parse on every failed call.
+_ERROR_CODE_RE = re.compile(rb'"code"\s*:\s*"([^"\\]*)"')
+_ERROR_MESSAGE_RE = re.compile(rb'"message"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _error_from_stderr(stderr: bytes, returncode: int) -> AuthyError:
+    """Build a typed :class:`AuthyError` from a failed command's stderr."""
+    # The JSON error is always the last line (progress notes may precede
+    # it); anything else is plain text and skips the regex scan entirely.
+    last = stderr.rstrip().rpartition(b"\n")[2].lstrip()
+    code = _ERROR_CODE_RE.search(last) if last.startswith(b"{") else None
+    if code is None:
+        message = stderr.decode("utf-8", "replace").strip()
+        return AuthyError(
+            exit_code=returncode,
+            error_code="unknown",
+            message=message or f"authy exited with code {returncode}",
+        )
+    error = {"code": code.group(1).decode("utf-8", "replace")}
+    message = _ERROR_MESSAGE_RE.search(last)
+    if message is not None:
+        # Only the string literal is decoded, to resolve its escapes.
+        error["message"] = _loads(b'"' + message.group(1) + b'"')
+    return _map_error(error, returncode)
+
+
+def _stdin_bytes(value: Union[str, bytes, None]) -> Optional[bytes]:
+    """Encode a stdin payload; bytes are passed through without a copy."""
+    if value is None or isinstance(value, bytes):
+        return value
+    return value.encode("utf-8")
+
+
+def _dotenv_line(name: str, value: str) -> str:
+    """Encode one secret as a double-quoted dotenv line for ``authy import``."""
+    if (
+        not name
+        or name != name.strip()
+        or "=" in name
+        or "\n" in name
+        or name.startswith("#")
+        # The importer strips a leading ``export `` from each line.
+        or name.startswith(("export ", "export\t"))
+    ):
+        raise ValueError(f"Secret name cannot be stored via import: {name!r}")
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+    return f'{name}="{escaped}"\n'
+
+
+# Longest --names value, in UTF-8 bytes, passed on the command line; Linux
+# rejects a single argument over 128 KiB (MAX_ARG_STRLEN) with E2BIG.
+_NAMES_ARG_MAX = 64 * 1024
+
+# ``authy import`` reports each existing secret it leaves alone on stderr.
+_IMPORT_SKIPPED_RE = re.compile(r"^Skipping '(.*)' \(already exists", re.MULTILINE)
+
+
+# How long a persistent server gets to exit after its stdin is closed (and
+# again after SIGTERM) before it is killed.
+_SHUTDOWN_TIMEOUT = 5.0
+
+
+def _server_exited() -> AuthyError:
+    return AuthyError(
+        exit_code=1,
+        error_code="unknown",
+        message="authy serve exited unexpectedly",
+    )
+
+
+class _McpSession:
+    """A long-lived ``authy serve --mcp`` child reused across calls.
+
+    Speaks line-delimited JSON-RPC 2.0 over the child's stdin/stdout, so the
+    binary is spawned once instead of once per operation.
+    """
+
+    __slots__ = ("_proc", "_next_id", "_lock")
+
+    def __init__(self, binary: str, env: Optional[Dict[str, str]]) -> None:
+        from . import __version__
+
+        # close_fds keeps its default: this child is spawned once and lives
+        # as long as the client, so it should not hold on to descriptors
+        # the parent made inheritable.
+        self._proc = subprocess.Popen(
+            [binary, "serve", "--mcp"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        self._next_id = 0
+        self._lock = threading.Lock()
+        try:
+            self._request("initialize", {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "authy-secrets", "version": __version__},
+            })
+            self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def alive(self) -> bool:
+        """Whether the server process is still running."""
+        return self._proc.poll() is None
+
+    def _send(self, message: dict) -> None:
+        assert self._proc.stdin is not None
+        try:
+            self._proc.stdin.write(_dumps(message) + b"\n")
+            self._proc.stdin.flush()
+        except OSError as exc:
+            # The server exited after the liveness check.
+            raise _server_exited() from exc
+
+    def _request(self, method: str, params: dict) -> Any:
+        assert self._proc.stdout is not None
+        with self._lock:
+            self._next_id += 1
+            self._send({
+                "jsonrpc": "2.0",
+                "id": self._next_id,
+                "method": method,
+                "params": params,
+            })
+            line = self._proc.stdout.readline()
+
+        if not line:
+            raise _server_exited()
+        response = _loads(line)
+        if "error" in response:
+            raise AuthyError(
+                exit_code=1,
+                error_code="unknown",
+                message=response["error"].get("message", "Unknown error"),
+            )
+        return response["result"]
+
+    def call_tool(self, name: str, arguments: Dict[str, Any]) -> str:
+        """Call an MCP tool and return its text content.
+
+        Raises a typed :class:`AuthyError` subclass if the tool failed.
+        """
+        result = self._request("tools/call", {"name": name, "arguments": arguments})
+        text = result["content"][0]["text"]
+        if result.get("isError"):
+            raise _map_message(text)
+        return text
+
+    def close(self) -> None:
+        """Close the server's stdin and wait for it to exit.
+
+        A server that does not exit within ``_SHUTDOWN_TIMEOUT`` is sent
+        SIGTERM, then killed.
+        """
+        if self._proc.stdin is not None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass  # Already exited; the pipe is broken.
+        for stop in (self._proc.terminate, self._proc.kill):
+            try:
+                self._proc.wait(timeout=_SHUTDOWN_TIMEOUT)
+                return
+            except subprocess.TimeoutExpired:
+                stop()
+        self._proc.wait()
 
 
 class Authy:
@@ -22,127 +349,446 @@ class Authy:
 
         with Authy(keyfile="/path/to/key") as client:
             client.get("db-url")
+
+    With ``persistent=True``, a single ``authy serve --mcp`` child serves
+    ``get``, ``list``, ``store`` and ``remove``, avoiding a process spawn
+    per call. It is started when the context is entered (or on first use)
+    and shut down on exit or by :meth:`close`. The server authenticates
+    from ``passphrase``/``keyfile`` only; combining it with ``token``
+    raises :class:`ValueError`.
+
+    With ``cache=True``, values read by :meth:`get` are remembered until
+    the client is closed. Writes made through the same client drop the
+    affected names; changes made by other processes are not seen while a
+    value is cached.
+
+    A session token (see :meth:`create_session`) plus the vault keyfile gives
+    read-only callers scoped access without the master credentials::
+
+        token = Authy(keyfile="/path/to/key").create_session("deploy", ttl="1h")
+        reader = Authy(keyfile="/path/to/key", token=token)
+
+    The CLI only reads a passphrase from ``AUTHY_PASSPHRASE``, so a
+    ``passphrase`` is kept in the child environment for the client's
+    lifetime and cannot be wiped from memory (Python strings are
+    immutable). Prefer ``keyfile`` where that matters. When a ``token`` is
+    given the passphrase is never used, so it is not forwarded.
     """
 
+    __slots__ = (
+        "_binary",
+        "_cmd_prefix",
+        "_extra_env",
+        "_env",
+        "_persistent",
+        "_session",
+        "_session_lock",
+        "_cache",
+    )
+
+    # Fixed argv pieces, built once; methods pick one instead of appending.
+    _EXPORT_ARGS = ("export", "--format", "json")
+    _IMPORT_ARGS = ("import", "-", "--keep-names")
+    _IMPORT_FORCE_ARGS = (*_IMPORT_ARGS, "--force")
+    _LIST_ARGS = ("list",)
+
     def __init__(
         self,
         binary: Optional[str] = None,
         passphrase: Optional[str] = None,
         keyfile: Optional[str] = None,
+        persistent: bool = False,
+        token: Optional[str] = None,
+        cache: bool = False,
     ) -> None:
-        if binary is not None:
-            self._binary = binary
-        else:
-            found = shutil.which("authy")
-            if found is None:
-                raise FileNotFoundError(
-                    "authy binary not found on PATH. "
-                    "Install authy or pass binary='/path/to/authy'."
-                )
-            self._binary = found
+        if persistent and token is not None:
+            raise ValueError(
+                "persistent=True cannot be combined with token: authy serve "
+                "--mcp authenticates with passphrase or keyfile only."
+            )
+        self._binary = _binary_path(binary)
+        self._cmd_prefix = (self._binary, "--json")
 
         self._extra_env: Dict[str, str] = {}
-        if passphrase is not None:
+        if passphrase is not None and token is None:
             self._extra_env["AUTHY_PASSPHRASE"] = passphrase
         if keyfile is not None:
             self._extra_env["AUTHY_KEYFILE"] = keyfile
+        if token is not None:
+            self._extra_env["AUTHY_TOKEN"] = token
+        # Child environment, merged once rather than on every call. Changes
+        # to os.environ after construction are not picked up. Without
+        # credentials the child simply inherits ours (env=None), so no copy
+        # is made at all.
+        self._env: Optional[Dict[str, str]] = (
+            {**os.environ, **self._extra_env} if self._extra_env else None
+        )
+
+        self._persistent = persistent
+        self._session: Optional[_McpSession] = None
+        self._session_lock = threading.Lock()
+        self._cache: Optional[Dict[str, str]] = {} if cache else None
 
     # -- context manager ------------------------------------------------
 
     def __enter__(self) -> "Authy":
+        self._mcp()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        # Nothing to clean up — env vars are scoped to subprocess calls,
-        # not injected into the current process.
-        pass
+        # Env vars are scoped to subprocess calls, not injected into the
+        # current process; only a persistent server needs shutting down.
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the persistent server, if one is running.
+
+        Also empties the ``cache=True`` value cache. A later call on a
+        ``persistent=True`` client starts a new server.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
 
     # -- internal -------------------------------------------------------
 
+    def _forget(self, *names: str) -> None:
+        """Drop cached values for ``names``, or all of them if none given."""
+        if self._cache is None:
+            return
+        if not names:
+            self._cache.clear()
+        for name in names:
+            self._cache.pop(name, None)
+
+    def _mcp(self) -> Optional[_McpSession]:
+        """Return the persistent server, starting it on first use.
+
+        Returns ``None`` for clients created without ``persistent=True``.
+        """
+        if not self._persistent:
+            return None
+        with self._session_lock:
+            if self._session is not None and not self._session.alive:
+                # The server died; reap it and start a new one.
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = _McpSession(self._binary, self._env)
+            return self._session
+
     def _run_cmd(
-        self, args: List[str], stdin: Optional[str] = None
-    ) -> dict:
+        self,
+        args: Sequence[str],
+        stdin: Union[str, bytes, None] = None,
+        decode: Callable[[bytes], Any] = _loads,
+    ) -> Any:
         """Run an authy CLI command with ``--json`` and return parsed output.
 
-        Raises a typed :class:`AuthyError` subclass on non-zero exit.
+        ``decode`` turns the raw stdout into the return value; it defaults
+        to a plain JSON parse, for which empty output yields ``{}``. A
+        custom ``decode`` always gets output: empty stdout raises
+        :class:`AuthyError`. Raises a typed :class:`AuthyError` subclass
+        on non-zero exit.
         """
-        cmd = [self._binary, "--json"] + args
-        env = {**os.environ, **self._extra_env}
+        cmd = [*self._cmd_prefix, *args]
 
+        # Binary pipes: the JSON parser takes the raw bytes, so stdout is
+        # never round-tripped through the locale codec. close_fds=False
+        # skips closing every descriptor above 2 in the child: descriptors
+        # Python opens are non-inheritable (PEP 446) and the CLI does not
+        # need any others.
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
-            input=stdin,
-            env=env,
+            input=_stdin_bytes(stdin),
+            env=self._env,
+            close_fds=False,
         )
 
         if result.returncode != 0:
-            # Parse structured error from stderr
-            try:
-                error_body = json.loads(result.stderr)
-                error = error_body["error"]
-            except (json.JSONDecodeError, KeyError):
-                raise AuthyError(
-                    exit_code=result.returncode,
-                    error_code="unknown",
-                    message=result.stderr.strip() or f"authy exited with code {result.returncode}",
-                )
-            raise _map_error(error, result.returncode)
+            raise _error_from_stderr(result.stderr, result.returncode)
 
         if result.stdout.strip():
-            return json.loads(result.stdout)
+            return decode(result.stdout)
+        if decode is not _loads:
+            raise AuthyError(
+                exit_code=result.returncode,
+                error_code="unknown",
+                message=f"authy {args[0]} printed no output",
+            )
         return {}
 
+    def _run_cmd_void(
+        self, args: Sequence[str], stdin: Union[str, bytes, None] = None
+    ) -> bytes:
+        """Run an authy CLI command whose stdout is not needed.
+
+        stdout goes straight to the null device, so no pipe is created or
+        drained for it; only stderr is captured, and returned. Raises a
+        typed :class:`AuthyError` subclass on non-zero exit.
+        """
+        result = subprocess.run(
+            [*self._cmd_prefix, *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            input=_stdin_bytes(stdin),
+            env=self._env,
+            close_fds=False,
+        )
+        if result.returncode != 0:
+            raise _error_from_stderr(result.stderr, result.returncode)
+        return result.stderr
+
+    def _flag_supported(self, flag: str) -> bool:
+        return (self._binary, flag) not in _UNSUPPORTED_FLAGS
+
+    def _flag_rejected(self, err: AuthyError, flag: str) -> bool:
+        """Whether ``err`` is the CLI rejecting ``flag``; remembered if so.
+
+        Argument errors come from the parser before ``--json`` handling, so
+        they arrive as plain text (``error_code == "unknown"``).
+        """
+        if err.error_code == "unknown" and f"'{flag}'" in err.message:
+            _UNSUPPORTED_FLAGS.add((self._binary, flag))
+            return True
+        return False
+
     # -- public API -----------------------------------------------------
 
     def get(self, name: str) -> str:
         """Get a secret value. Raises :class:`SecretNotFound` if missing."""
-        result = self._run_cmd(["get", name])
-        return result["value"]
+        if self._cache is not None and name in self._cache:
+            return self._cache[name]
+        session = self._mcp()
+        if session is not None:
+            value = session.call_tool("get_secret", {"name": name})
+        else:
+            value = self._run_cmd(["get", name], decode=_decode_value)
+        if self._cache is not None:
+            self._cache[name] = value
+        return value
 
     def get_or_none(self, name: str) -> Optional[str]:
-        """Get a secret value, returning ``None`` if not found."""
-        from .errors import SecretNotFound
+        """Get a secret value, returning ``None`` if not found.
 
+        Uses ``get --allow-missing`` so a miss is a normal response rather
+        than an error to be parsed and raised. CLIs without the flag fall
+        back to catching :class:`SecretNotFound` from :meth:`get`.
+        """
+        if (
+            self._persistent
+            or (self._cache is not None and name in self._cache)
+            or not self._flag_supported("--allow-missing")
+        ):
+            try:
+                return self.get(name)
+            except SecretNotFound:
+                return None
         try:
-            return self.get(name)
-        except SecretNotFound:
-            return None
-
-    def store(self, name: str, value: str, force: bool = False) -> None:
-        """Store a secret. The value is passed via stdin, never as argv."""
-        args = ["store", name]
+            result = self._run_cmd(["get", name, "--allow-missing"])
+        except AuthyError as exc:
+            if not self._flag_rejected(exc, "--allow-missing"):
+                raise
+            return self.get_or_none(name)
+        value = result.get("value")
+        if value is not None and self._cache is not None:
+            self._cache[name] = value
+        return value
+
+    def get_many(self, names: Iterable[str]) -> Dict[str, str]:
+        """Get several secret values with a single CLI invocation.
+
+        Runs ``authy export --format json --names ...`` once instead of one
+        ``get`` per name, so the vault is decrypted a single time for the
+        whole batch. CLIs without ``--names``, and batches too large for one
+        argument, export everything and the result is filtered here.
+        Raises :class:`SecretNotFound` if any of the names is missing.
+        """
+        wanted = list(names)
+        if not wanted:
+            return {}
+        args = self._EXPORT_ARGS
+        values = None
+        joined = ",".join(wanted)
+        # The CLI splits --names on commas, and one argv string is capped by
+        # the kernel, so such batches need a full export instead.
+        if (
+            self._flag_supported("--names")
+            and len(joined.encode("utf-8")) <= _NAMES_ARG_MAX
+            and not any("," in n for n in wanted)
+        ):
+            try:
+                # Attached with "=" so a name starting with "-" stays a value.
+                values = self._run_cmd(
+                    [*args, f"--names={joined}"], decode=_decode_values
+                )
+            except AuthyError as exc:
+                if not self._flag_rejected(exc, "--names"):
+                    raise
+        if values is None:
+            values = self._run_cmd(args, decode=_decode_values)
+        result: Dict[str, str] = {}
+        for name in wanted:
+            if name not in values:
+                raise SecretNotFound(
+                    exit_code=3,
+                    error_code="not_found",
+                    message=f"Secret not found: {name}",
+                )
+            result[name] = values[name]
+        return result
+
+    def get_many_parallel(
+        self, names: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, str]:
+        """Get several secret values with concurrent ``get`` calls.
+
+        Each name still costs one CLI invocation, but the subprocess waits
+        overlap on a thread pool. Useful when the caller may only read
+        individual secrets (e.g. with a scoped session token) and
+        :meth:`get_many` is not an option. Raises :class:`SecretNotFound`
+        if any of the names is missing.
+        """
+        wanted = list(names)
+        if not wanted:
+            return {}
+        if self._persistent:
+            # One server answers requests in order; threads would only queue.
+            return {name: self.get(name) for name in wanted}
+        workers = min(max_workers, len(wanted))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(wanted, pool.map(self.get, wanted)))
+
+    def store(self, name: str, value: Union[str, bytes], force: bool = False) -> None:
+        """Store a secret. The value is passed via stdin, never as argv.
+
+        ``value`` may be ``bytes`` already encoded as UTF-8, which is piped
+        to the CLI as-is.
+        """
+        self._forget(name)
+        session = self._mcp()
+        if session is not None:
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            session.call_tool(
+                "store_secret", {"name": name, "value": value, "force": force}
+            )
+            return
+        args = ("store", name, "--force") if force else ("store", name)
+        self._run_cmd_void(args, stdin=value)
+
+    def store_many(self, secrets: Mapping[str, str], force: bool = False) -> None:
+        """Store several secrets with a single CLI invocation.
+
+        The values are piped to ``authy import -`` as a dotenv document, so
+        the vault is decrypted and written once for the whole batch. Names
+        are kept verbatim. With ``force`` existing secrets are overwritten;
+        otherwise they are left unchanged and :class:`SecretAlreadyExists`
+        is raised listing them, after the remaining secrets are stored.
+        """
+        if not secrets:
+            return
+        self._forget(*secrets)
+        args = self._IMPORT_FORCE_ARGS if force else self._IMPORT_ARGS
+        payload = "".join(_dotenv_line(n, v) for n, v in secrets.items())
+        stderr = self._run_cmd_void(args, stdin=payload)
         if force:
-            args.append("--force")
-        self._run_cmd(args, stdin=value)
+            return
+        skipped = _IMPORT_SKIPPED_RE.findall(stderr.decode("utf-8", "replace"))
+        if skipped:
+            raise SecretAlreadyExists(
+                exit_code=5,
+                error_code="already_exists",
+                message=f"Secret already exists: {', '.join(skipped)}",
+            )
 
     def remove(self, name: str) -> bool:
         """Remove a secret. Returns ``True`` on success.
 
         Raises :class:`SecretNotFound` if the secret does not exist.
         """
-        self._run_cmd(["remove", name])
+        self._forget(name)
+        session = self._mcp()
+        if session is not None:
+            text = session.call_tool("remove_secret", {"name": name})
+            if text.endswith("not found"):
+                raise SecretNotFound(
+                    exit_code=3,
+                    error_code="not_found",
+                    message=f"Secret not found: {name}",
+                )
+            return True
+        self._run_cmd_void(["remove", name])
         return True
 
-    def rotate(self, name: str, new_value: str) -> int:
+    def rotate(self, name: str, new_value: Union[str, bytes]) -> int:
         """Rotate a secret to a new value. Returns the new version number.
 
-        The new value is passed via stdin, never as argv.
+        The new value is passed via stdin, never as argv; like :meth:`store`
+        it may be UTF-8 ``bytes``.
         Raises :class:`SecretNotFound` if the secret does not exist.
         """
-        self._run_cmd(["rotate", name], stdin=new_value)
-        # After rotation, fetch the secret to get the new version
-        result = self._run_cmd(["get", name])
+        self._forget(name)
+        result = self._run_cmd(["rotate", name], stdin=new_value)
+        if not result:
+            # Older CLIs print nothing on rotate; read the version back.
+            result = self._run_cmd(["get", name])
         return result["version"]
 
     def list(self, scope: Optional[str] = None) -> List[str]:
-        """List secret names, optionally filtered by a policy scope."""
-        args = ["list"]
-        if scope is not None:
-            args.extend(["--scope", scope])
-        result = self._run_cmd(args)
-        return [s["name"] for s in result.get("secrets", [])]
+        """List secret names, optionally filtered by a policy scope.
+
+        The whole response is read and parsed at once; use
+        :meth:`iter_list` to stream names from very large vaults.
+        """
+        session = self._mcp()
+        if session is not None:
+            arguments = {"scope": scope} if scope is not None else {}
+            return _loads(session.call_tool("list_secrets", arguments))
+        args = self._LIST_ARGS if scope is None else ("list", "--scope", scope)
+        return self._run_cmd(args, decode=_decode_list)
+
+    def iter_list(self, scope: Optional[str] = None) -> Iterator[str]:
+        """Yield secret names, optionally filtered by a policy scope.
+
+        With ``ijson`` installed the ``list`` response is parsed
+        incrementally straight from the pipe, so memory stays flat however
+        large the vault is; otherwise the whole response is parsed at once.
+        """
+        if self._persistent:
+            yield from self.list(scope)
+            return
+
+        args = self._LIST_ARGS if scope is None else ("list", "--scope", scope)
+
+        with subprocess.Popen(
+            [*self._cmd_prefix, *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self._env,
+            close_fds=False,
+        ) as proc:
+            assert proc.stdout is not None and proc.stderr is not None
+            try:
+                if ijson is not None:
+                    yield from ijson.items(proc.stdout, "secrets.item.name")
+                else:
+                    raw = proc.stdout.read()
+                    if raw.strip():
+                        yield from _decode_list(raw)
+            except (ValueError, _StreamError):
+                # A failed command leaves stdout empty; report its error instead.
+                if proc.wait() == 0:
+                    raise
+            stderr = proc.stderr.read()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            raise _error_from_stderr(stderr, returncode)
 
     def run(
         self,
@@ -155,55 +801,83 @@ class Authy:
         Note: this calls authy run which replaces the process, so we invoke
         it as a subprocess and capture its result.
         """
-        args = ["run"]
+        args = [self._binary, "run"]
         if scope is not None:
             args.extend(["--scope", scope])
         args.append("--")
         args.extend(command)
 
-        cmd = [self._binary] + args
-        env = {**os.environ, **self._extra_env}
-
-        return subprocess.run(cmd, capture_output=True, text=True, env=env)
+        # close_fds stays at its default here: the CLI execs the caller's
+        # command, which should not inherit the parent's descriptors.
+        return subprocess.run(args, capture_output=True, text=True, env=self._env)
 
     def import_dotenv(self, path: str, force: bool = False) -> None:
         """Import secrets from a .env file."""
-        args = ["import", path]
-        if force:
-            args.append("--force")
-        self._run_cmd(args)
+        # Imported names are transformed by the CLI, so drop every entry.
+        self._forget()
+        args = ("import", path, "--force") if force else ("import", path)
+        self._run_cmd_void(args)
+
+    def create_session(
+        self,
+        scope: str,
+        ttl: str = "1h",
+        label: Optional[str] = None,
+        run_only: bool = False,
+    ) -> str:
+        """Create a read-only session token for a policy scope.
+
+        Requires master credentials. The returned token is passed as
+        ``Authy(token=...)`` together with the vault keyfile.
+        """
+        args = ["session", "create", "--scope", scope, "--ttl", ttl]
+        if label is not None:
+            args.extend(["--label", label])
+        if run_only:
+            args.append("--run-only")
+        result = self._run_cmd(args)
+        return result["token"]
 
     def init(self) -> None:
         """Initialize a new vault."""
-        self._run_cmd(["init"])
+        self._run_cmd_void(["init"])
 
     @staticmethod
     def is_initialized(binary: Optional[str] = None) -> bool:
         """Check whether a vault is initialized. Does not require auth.
 
-        This runs ``authy get __probe`` and checks whether the error is
-        *not* ``vault_not_initialized``. A vault-not-initialized error
+        This runs ``authy status``, which only checks for the vault file and
+        never derives a key. CLIs without ``status`` are probed with
+        ``authy get __probe`` instead: a vault-not-initialized error
         (exit 7) means no vault exists; any other error means a vault
         is present (auth may still be required to use it).
         """
-        bin_path = binary or shutil.which("authy")
-        if bin_path is None:
-            raise FileNotFoundError("authy binary not found on PATH.")
+        bin_path = _binary_path(binary)
 
+        result = subprocess.run(
+            [bin_path, "--json", "status"],
+            capture_output=True,
+            close_fds=False,
+        )
+        if result.returncode == 0:
+            try:
+                return bool(_loads(result.stdout)["initialized"])
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        # Older CLIs have no `status` command; fall back to a probe read.
         result = subprocess.run(
             [bin_path, "--json", "get", "__probe"],
             capture_output=True,
-            text=True,
+            close_fds=False,
         )
 
         if result.returncode == 0:
             return True
 
-        try:
-            error_body = json.loads(result.stderr)
-            code = error_body["error"]["code"]
-        except (json.JSONDecodeError, KeyError):
+        code = _ERROR_CODE_RE.search(result.stderr)
+        if code is None:
             # Can't parse — assume initialized (vault exists but errored)
             return True
 
-        return code != "vault_not_initialized"
+        return code.group(1) != b"vault_not_initialized"
@@ -6,6 +6,8 @@ from __future__ import annotations
 class AuthyError(Exception):
     """Base error with exit_code and error_code from authy CLI."""
 
+    __slots__ = ("exit_code", "error_code", "message")
+
     def __init__(self, exit_code: int, error_code: str, message: str) -> None:
         self.exit_code = exit_code
         self.error_code = error_code
@@ -16,22 +18,32 @@ class AuthyError(Exception):
 class SecretNotFound(AuthyError):
     """Raised when a requested secret does not exist (exit code 3, code not_found)."""
 
+    __slots__ = ()
+
 
 class SecretAlreadyExists(AuthyError):
     """Raised when storing a secret that already exists without --force (exit code 5)."""
 
+    __slots__ = ()
+
 
 class AuthFailed(AuthyError):
     """Raised when authentication fails (exit code 2)."""
 
+    __slots__ = ()
+
 
 class PolicyDenied(AuthyError):
     """Raised when access is denied by a policy (exit code 4)."""
 
+    __slots__ = ()
+
 
 class VaultNotFound(AuthyError):
     """Raised when the vault is not initialized (exit code 7)."""
 
+    __slots__ = ()
+
 
 # Mapping from (exit_code) to exception class.
 # Some exit codes map to multiple error_codes; we use the exit code as the
@@ -51,3 +63,28 @@ def _map_error(error: dict, exit_code: int) -> AuthyError:
     message = error.get("message", "Unknown error")
     cls = _EXIT_CODE_MAP.get(exit_code, AuthyError)
     return cls(exit_code=exit_code, error_code=code, message=message)
+
+
+# The MCP server (``authy serve --mcp``) reports tool failures as plain text
+# without an exit code, so the category is recovered from the message head
+# (the text before the first ":" or ".") produced by the CLI's error type.
+_MESSAGE_HEAD_MAP: dict[str, tuple[int, str]] = {
+    "Secret not found": (3, "not_found"),
+    "Policy not found": (3, "not_found"),
+    "Secret already exists": (5, "already_exists"),
+    "Access denied": (4, "access_denied"),
+    "Authentication failed": (2, "auth_failed"),
+    "No credentials configured": (2, "auth_failed"),
+    "Decryption error": (2, "decryption_error"),
+    "Vault not initialized": (7, "vault_not_initialized"),
+}
+
+
+def _map_message(message: str) -> AuthyError:
+    """Map a plain-text error message from the MCP server to a typed exception."""
+    head = message.partition(":")[0].partition(".")[0]
+    entry = _MESSAGE_HEAD_MAP.get(head)
+    if entry is None:
+        return AuthyError(exit_code=1, error_code="unknown", message=message)
+    exit_code, code = entry
+    return _map_error({"code": code, "message": message}, exit_code)
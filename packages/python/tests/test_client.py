@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import importlib.util
+import io
 import json
+import os
 import subprocess
+import sys
+from types import ModuleType
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,6 +23,21 @@ from authy_secrets import (
     SecretNotFound,
     VaultNotFound,
 )
+from authy_secrets.client import _UNSUPPORTED_FLAGS, _resolve_authy
+
+
+@pytest.fixture(autouse=True)
+def _clear_binary_cache() -> None:
+    # Tests patch shutil.which, so never reuse a cached PATH lookup.
+    _resolve_authy.cache_clear()
+    _UNSUPPORTED_FLAGS.clear()
+
+
+@pytest.fixture(scope="module")
+def client() -> Authy:
+    # Construction is covered by TestConstruction; other tests share one
+    # plain client and patch subprocess per test.
+    return Authy(binary="/bin/authy")
 
 
 # ---------------------------------------------------------------------------
@@ -24,8 +45,8 @@ from authy_secrets import (
 # ---------------------------------------------------------------------------
 
 def _completed(
-    stdout: str = "",
-    stderr: str = "",
+    stdout: bytes = b"",
+    stderr: bytes = b"",
     returncode: int = 0,
 ) -> subprocess.CompletedProcess:
     return subprocess.CompletedProcess(
@@ -33,13 +54,42 @@ def _completed(
     )
 
 
-def _json_stdout(data: dict) -> subprocess.CompletedProcess:
-    return _completed(stdout=json.dumps(data))
+def _json_stdout(data: Any) -> subprocess.CompletedProcess:
+    return _completed(stdout=json.dumps(data).encode())
 
 
 def _json_error(code: str, message: str, exit_code: int) -> subprocess.CompletedProcess:
     body = {"error": {"code": code, "message": message, "exit_code": exit_code}}
-    return _completed(stderr=json.dumps(body), returncode=exit_code)
+    return _completed(stderr=json.dumps(body).encode(), returncode=exit_code)
+
+
+def _popen(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0) -> MagicMock:
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = io.BytesIO(stdout)
+    proc.stderr = io.BytesIO(stderr)
+    proc.wait.return_value = returncode
+    return proc
+
+
+def _mcp_process(*tool_results: dict) -> MagicMock:
+    """Fake ``authy serve --mcp`` child answering initialize, then each tool call."""
+    results = [{"protocolVersion": "2024-11-05", "capabilities": {"tools": {}}}]
+    results.extend(tool_results)
+    proc = MagicMock()
+    proc.poll.return_value = None
+    proc.stdout.readline.side_effect = [
+        json.dumps({"jsonrpc": "2.0", "id": i, "result": r}).encode() + b"\n"
+        for i, r in enumerate(results, start=1)
+    ]
+    return proc
+
+
+def _tool_text(text: str, is_error: bool = False) -> dict:
+    result: dict = {"content": [{"type": "text", "text": text}]}
+    if is_error:
+        result["isError"] = True
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -51,7 +101,7 @@ class TestConstruction:
     def test_finds_binary_on_path(self, mock_which: MagicMock) -> None:
         client = Authy()
         assert client._binary == "/usr/bin/authy"
-        mock_which.assert_called_once_with("authy")
+        mock_which.assert_called_once_with("authy", path=os.environ.get("PATH"))
 
     def test_custom_binary_path(self) -> None:
         client = Authy(binary="/opt/authy/bin/authy")
@@ -62,6 +112,35 @@ class TestConstruction:
         with pytest.raises(FileNotFoundError, match="authy binary not found"):
             Authy()
 
+    @patch("authy_secrets.client.shutil.which", return_value="/usr/bin/authy")
+    def test_path_lookup_is_cached(self, mock_which: MagicMock) -> None:
+        Authy()
+        Authy()
+        with patch("authy_secrets.client.subprocess.run") as mock_run:
+            mock_run.return_value = _json_stdout({"initialized": True})
+            Authy.is_initialized()
+        mock_which.assert_called_once_with("authy", path=os.environ.get("PATH"))
+
+    @patch("authy_secrets.client.shutil.which", return_value="/usr/bin/authy")
+    def test_path_change_repeats_lookup(
+        self, mock_which: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("PATH", "/usr/bin")
+        Authy()
+        monkeypatch.setenv("PATH", "/opt/authy/bin:/usr/bin")
+        Authy()
+        assert mock_which.call_count == 2
+        mock_which.assert_called_with("authy", path="/opt/authy/bin:/usr/bin")
+
+    @patch("authy_secrets.client.shutil.which", return_value="bin/authy")
+    def test_binary_resolved_to_absolute_path(self, mock_which: MagicMock) -> None:
+        client = Authy()
+        assert client._binary == os.path.abspath("bin/authy")
+
+        client2 = Authy(binary="authy")
+        assert client2._binary == os.path.abspath("bin/authy")
+        mock_which.assert_called_with("authy")
+
     def test_credentials_in_env(self) -> None:
         client = Authy(binary="/bin/authy", passphrase="s3cret")
         assert client._extra_env["AUTHY_PASSPHRASE"] == "s3cret"
@@ -69,6 +148,22 @@ class TestConstruction:
         client2 = Authy(binary="/bin/authy", keyfile="/path/to/key")
         assert client2._extra_env["AUTHY_KEYFILE"] == "/path/to/key"
 
+        client3 = Authy(binary="/bin/authy", keyfile="/path/to/key", token="authy_v1.x")
+        assert client3._extra_env["AUTHY_TOKEN"] == "authy_v1.x"
+
+    def test_persistent_with_token_rejected(self) -> None:
+        with pytest.raises(ValueError, match="token"):
+            Authy(binary="/bin/authy", keyfile="/k", token="authy_v1.x", persistent=True)
+
+    def test_passphrase_not_forwarded_with_token(self) -> None:
+        client = Authy(
+            binary="/bin/authy",
+            passphrase="s3cret",
+            keyfile="/path/to/key",
+            token="authy_v1.x",
+        )
+        assert "AUTHY_PASSPHRASE" not in client._extra_env
+
 
 # ---------------------------------------------------------------------------
 # get / get_or_none
@@ -76,7 +171,7 @@ class TestConstruction:
 
 class TestGet:
     @patch("authy_secrets.client.subprocess.run")
-    def test_get_returns_value(self, mock_run: MagicMock) -> None:
+    def test_get_returns_value(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_stdout({
             "name": "db-url",
             "value": "postgres://localhost/mydb",
@@ -84,30 +179,55 @@ class TestGet:
             "created": "2025-01-01T00:00:00Z",
             "modified": "2025-01-01T00:00:00Z",
         })
-        client = Authy(binary="/bin/authy")
         assert client.get("db-url") == "postgres://localhost/mydb"
 
         # Verify the CLI was called with --json get <name>
         call_args = mock_run.call_args
         assert call_args[0][0] == ["/bin/authy", "--json", "get", "db-url"]
+        assert call_args[1]["close_fds"] is False
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_get_not_found_raises(self, mock_run: MagicMock) -> None:
+    def test_get_empty_output_raises(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = _completed()
+        client = Authy(binary="/bin/authy", cache=True)
+        with pytest.raises(AuthyError, match="printed no output"):
+            client.get("db-url")
+        assert client._cache == {}
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_not_found_raises(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_error("not_found", "Secret not found: db-url", 3)
-        client = Authy(binary="/bin/authy")
         with pytest.raises(SecretNotFound) as exc_info:
             client.get("db-url")
         assert exc_info.value.exit_code == 3
         assert exc_info.value.error_code == "not_found"
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_get_or_none_returns_none(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = _json_error("not_found", "Secret not found: db-url", 3)
-        client = Authy(binary="/bin/authy")
+    def test_get_or_none_returns_none(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _json_stdout({"name": "db-url", "value": None})
         assert client.get_or_none("db-url") is None
+        assert mock_run.call_args[0][0] == [
+            "/bin/authy", "--json", "get", "db-url", "--allow-missing"
+        ]
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_get_or_none_returns_value(self, mock_run: MagicMock) -> None:
+    def test_get_or_none_older_cli(self, mock_run: MagicMock, client: Authy) -> None:
+        rejected = _completed(
+            stderr=b"error: unexpected argument '--allow-missing' found\n",
+            returncode=2,
+        )
+        missing = _json_error("not_found", "Secret not found: db-url", 3)
+        mock_run.side_effect = [rejected, missing, missing]
+        assert client.get_or_none("db-url") is None
+        # Detected once; later lookups use plain get straight away.
+        assert client.get_or_none("db-url") is None
+        assert mock_run.call_count == 3
+        assert mock_run.call_args[0][0] == ["/bin/authy", "--json", "get", "db-url"]
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_or_none_returns_value(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
         mock_run.return_value = _json_stdout({
             "name": "db-url",
             "value": "postgres://localhost/mydb",
@@ -115,62 +235,236 @@ class TestGet:
             "created": "2025-01-01T00:00:00Z",
             "modified": "2025-01-01T00:00:00Z",
         })
-        client = Authy(binary="/bin/authy")
         assert client.get_or_none("db-url") == "postgres://localhost/mydb"
 
 
+# ---------------------------------------------------------------------------
+# get_many
+# ---------------------------------------------------------------------------
+
+class TestGetMany:
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_uses_single_export(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _json_stdout([
+            {"name": "api-key", "value": "sk-1", "version": 1,
+             "created": "2025-01-01T00:00:00Z", "modified": "2025-01-01T00:00:00Z"},
+            {"name": "db-url", "value": "postgres://db", "version": 2,
+             "created": "2025-01-01T00:00:00Z", "modified": "2025-01-02T00:00:00Z"},
+            {"name": "other", "value": "o", "version": 1,
+             "created": "2025-01-01T00:00:00Z", "modified": "2025-01-01T00:00:00Z"},
+        ])
+        assert client.get_many(["db-url", "api-key"]) == {
+            "db-url": "postgres://db",
+            "api-key": "sk-1",
+        }
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == [
+            "/bin/authy", "--json", "export", "--format", "json",
+            "--names=db-url,api-key",
+        ]
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_dash_name_attached(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _json_stdout([{"name": "-x", "value": "1"}])
+        assert client.get_many(["-x"]) == {"-x": "1"}
+        assert mock_run.call_args[0][0][-1] == "--names=-x"
+
+    @pytest.mark.parametrize("names", [
+        ["a,b"],
+        ["n" * 1000 + str(i) for i in range(100)],
+        # Under the cap in characters, over it in UTF-8 bytes.
+        ["\u5bc6\u94a5" * 10 + str(i) for i in range(2000)],
+    ])
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_full_export_fallback(
+        self, mock_run: MagicMock, names: list, client: Authy
+    ) -> None:
+        mock_run.return_value = _json_stdout([{"name": n, "value": "v"} for n in names])
+        assert client.get_many(names) == {n: "v" for n in names}
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == [
+            "/bin/authy", "--json", "export", "--format", "json"
+        ]
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_older_cli_without_names(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        rejected = _completed(
+            stderr=b"error: unexpected argument '--names' found\n", returncode=2
+        )
+        exported = _json_stdout([{"name": "a", "value": "1"}])
+        mock_run.side_effect = [rejected, exported, exported]
+        assert client.get_many(["a"]) == {"a": "1"}
+        # The rejection is remembered; the next batch goes straight to export.
+        assert client.get_many(["a"]) == {"a": "1"}
+        assert mock_run.call_count == 3
+        assert not any(a.startswith("--names") for a in mock_run.call_args[0][0])
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_missing_raises(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _json_stdout([])
+        with pytest.raises(SecretNotFound) as exc_info:
+            client.get_many(["db-url"])
+        assert exc_info.value.exit_code == 3
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_empty_skips_cli(self, mock_run: MagicMock, client: Authy) -> None:
+        assert client.get_many([]) == {}
+        mock_run.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # store
 # ---------------------------------------------------------------------------
 
 class TestStore:
     @patch("authy_secrets.client.subprocess.run")
-    def test_store_passes_value_via_stdin(self, mock_run: MagicMock) -> None:
+    def test_store_passes_value_via_stdin(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
         mock_run.return_value = _completed()
-        client = Authy(binary="/bin/authy")
         client.store("api-key", "sk-1234")
 
         call_args = mock_run.call_args
         assert call_args[0][0] == ["/bin/authy", "--json", "store", "api-key"]
-        assert call_args[1]["input"] == "sk-1234"
+        assert call_args[1]["input"] == b"sk-1234"
+        # Nothing is read back from a store
+        assert call_args[1]["stdout"] == subprocess.DEVNULL
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_store_bytes_passed_through(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _completed()
+        value = "sk-\u00e9".encode("utf-8")
+        client.store("api-key", value)
+        assert mock_run.call_args[1]["input"] is value
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_store_with_force(self, mock_run: MagicMock) -> None:
+    def test_store_with_force(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _completed()
-        client = Authy(binary="/bin/authy")
         client.store("api-key", "sk-5678", force=True)
 
         call_args = mock_run.call_args
         assert call_args[0][0] == ["/bin/authy", "--json", "store", "api-key", "--force"]
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_store_duplicate_raises(self, mock_run: MagicMock) -> None:
+    def test_store_duplicate_raises(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_error(
             "already_exists",
             "Secret already exists: api-key (use --force to overwrite)",
             5,
         )
-        client = Authy(binary="/bin/authy")
         with pytest.raises(SecretAlreadyExists) as exc_info:
             client.store("api-key", "sk-1234")
         assert exc_info.value.exit_code == 5
 
 
+class TestGetManyParallel:
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_parallel_runs_one_get_per_name(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        def fake_run(cmd: list, **kwargs: Any) -> subprocess.CompletedProcess:
+            name = cmd[-1]
+            return _json_stdout({
+                "name": name,
+                "value": f"value-of-{name}",
+                "version": 1,
+                "created": "2025-01-01T00:00:00Z",
+                "modified": "2025-01-01T00:00:00Z",
+            })
+
+        mock_run.side_effect = fake_run
+        result = client.get_many_parallel(["a", "b", "c"], max_workers=2)
+        assert result == {"a": "value-of-a", "b": "value-of-b", "c": "value-of-c"}
+        assert list(result) == ["a", "b", "c"]
+        assert mock_run.call_count == 3
+
+    @patch("authy_secrets.client.ThreadPoolExecutor")
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_get_many_parallel_persistent_skips_threads(
+        self, mock_popen: MagicMock, mock_pool: MagicMock
+    ) -> None:
+        mock_popen.return_value = _mcp_process(_tool_text("1"), _tool_text("2"))
+        with Authy(binary="/bin/authy", persistent=True) as client:
+            assert client.get_many_parallel(["a", "b"]) == {"a": "1", "b": "2"}
+        mock_pool.assert_not_called()
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_get_many_parallel_missing_raises(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _json_error("not_found", "Secret not found: a", 3)
+        with pytest.raises(SecretNotFound):
+            client.get_many_parallel(["a"])
+
+
+class TestStoreMany:
+    @patch("authy_secrets.client.subprocess.run")
+    def test_store_many_pipes_dotenv_to_import(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _completed()
+        client.store_many({"api-key": "sk-1234", "motd": 'say "hi"\nbye'})
+
+        assert mock_run.call_count == 1
+        call_args = mock_run.call_args
+        assert call_args[0][0] == [
+            "/bin/authy", "--json", "import", "-", "--keep-names"
+        ]
+        assert call_args[1]["input"] == (
+            b'api-key="sk-1234"\n'
+            b'motd="say \\"hi\\"\\nbye"\n'
+        )
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_store_many_with_force(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _completed()
+        client.store_many({"api-key": "sk-5678"}, force=True)
+        assert mock_run.call_args[0][0] == [
+            "/bin/authy", "--json", "import", "-", "--keep-names", "--force"
+        ]
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_store_many_existing_raises(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _completed(stderr=(
+            b"Skipping 'api-key' (already exists, use --force to overwrite)\n"
+            b"Skipping 'db-url' (already exists, use --force to overwrite)\n"
+            b"1 secret(s) imported, 2 skipped.\n"
+        ))
+        with pytest.raises(SecretAlreadyExists) as exc_info:
+            client.store_many({"api-key": "a", "db-url": "b", "motd": "c"})
+        assert exc_info.value.exit_code == 5
+        assert exc_info.value.message == "Secret already exists: api-key, db-url"
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_store_many_none_skipped(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _completed(stderr=b"2 secret(s) imported, 0 skipped.\n")
+        client.store_many({"api-key": "a", "db-url": "b"})
+
+    @pytest.mark.parametrize("name", ["a=b", "#a", " a", "export a", "export\ta"])
+    def test_store_many_rejects_unencodable_name(self, name: str, client: Authy) -> None:
+        with pytest.raises(ValueError):
+            client.store_many({name: "v"})
+
+
 # ---------------------------------------------------------------------------
 # remove
 # ---------------------------------------------------------------------------
 
 class TestRemove:
     @patch("authy_secrets.client.subprocess.run")
-    def test_remove_returns_true(self, mock_run: MagicMock) -> None:
+    def test_remove_returns_true(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _completed()
-        client = Authy(binary="/bin/authy")
         assert client.remove("old-secret") is True
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_remove_not_found_raises(self, mock_run: MagicMock) -> None:
+    def test_remove_not_found_raises(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_error("not_found", "Secret not found: old-secret", 3)
-        client = Authy(binary="/bin/authy")
         with pytest.raises(SecretNotFound):
             client.remove("old-secret")
 
@@ -181,7 +475,21 @@ class TestRemove:
 
 class TestRotate:
     @patch("authy_secrets.client.subprocess.run")
-    def test_rotate_returns_version(self, mock_run: MagicMock) -> None:
+    def test_rotate_returns_version(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _json_stdout({"name": "api-key", "version": 2})
+        version = client.rotate("api-key", "new-val")
+        assert version == 2
+
+        # A single rotate call, with the value on stdin
+        assert mock_run.call_count == 1
+        rotate_call = mock_run.call_args
+        assert rotate_call[0][0] == ["/bin/authy", "--json", "rotate", "api-key"]
+        assert rotate_call[1]["input"] == b"new-val"
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_rotate_falls_back_to_get_on_older_cli(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
         # First call: rotate (no stdout)
         # Second call: get (returns version)
         mock_run.side_effect = [
@@ -194,14 +502,8 @@ class TestRotate:
                 "modified": "2025-01-02T00:00:00Z",
             }),
         ]
-        client = Authy(binary="/bin/authy")
-        version = client.rotate("api-key", "new-val")
-        assert version == 2
-
-        # Verify rotate was called with stdin
-        rotate_call = mock_run.call_args_list[0]
-        assert rotate_call[0][0] == ["/bin/authy", "--json", "rotate", "api-key"]
-        assert rotate_call[1]["input"] == "new-val"
+        assert client.rotate("api-key", "new-val") == 2
+        assert mock_run.call_args_list[1][0][0] == ["/bin/authy", "--json", "get", "api-key"]
 
 
 # ---------------------------------------------------------------------------
@@ -210,35 +512,80 @@ class TestRotate:
 
 class TestList:
     @patch("authy_secrets.client.subprocess.run")
-    def test_list_returns_names(self, mock_run: MagicMock) -> None:
+    def test_list_returns_names(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_stdout({
             "secrets": [
                 {"name": "db-url", "version": 1, "created": "2025-01-01T00:00:00Z", "modified": "2025-01-01T00:00:00Z"},
                 {"name": "api-key", "version": 3, "created": "2025-01-01T00:00:00Z", "modified": "2025-01-02T00:00:00Z"},
             ]
         })
-        client = Authy(binary="/bin/authy")
         names = client.list()
         assert names == ["db-url", "api-key"]
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_list_with_scope(self, mock_run: MagicMock) -> None:
+    def test_list_with_scope(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_stdout({
             "secrets": [
                 {"name": "db-url", "version": 1, "created": "2025-01-01T00:00:00Z", "modified": "2025-01-01T00:00:00Z"},
             ]
         })
-        client = Authy(binary="/bin/authy")
         names = client.list(scope="deploy")
         call_args = mock_run.call_args
         assert call_args[0][0] == ["/bin/authy", "--json", "list", "--scope", "deploy"]
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_list_empty(self, mock_run: MagicMock) -> None:
+    def test_list_empty(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_stdout({"secrets": []})
-        client = Authy(binary="/bin/authy")
         assert client.list() == []
 
+    @patch("authy_secrets.client._decode_names")
+    @patch("authy_secrets.client.subprocess.run")
+    def test_list_empty_skips_parser(
+        self, mock_run: MagicMock, mock_decode: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _completed(stdout=b'{"secrets":[]}\n')
+        assert client.list() == []
+        mock_decode.assert_not_called()
+
+
+class TestIterList:
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_iter_list_yields_names(self, mock_popen: MagicMock, client: Authy) -> None:
+        mock_popen.return_value = _popen(stdout=json.dumps({
+            "secrets": [
+                {"name": "db-url", "version": 1, "created": "2025-01-01T00:00:00Z", "modified": "2025-01-01T00:00:00Z"},
+                {"name": "api-key", "version": 3, "created": "2025-01-01T00:00:00Z", "modified": "2025-01-02T00:00:00Z"},
+            ]
+        }).encode())
+        assert list(client.iter_list(scope="deploy")) == ["db-url", "api-key"]
+        assert mock_popen.call_args[0][0] == [
+            "/bin/authy", "--json", "list", "--scope", "deploy"
+        ]
+
+    @patch("authy_secrets.client.ijson", None)
+    @patch("authy_secrets.client._decode_names")
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_iter_list_without_ijson_reuses_list_decoder(
+        self, mock_popen: MagicMock, mock_decode: MagicMock, client: Authy
+    ) -> None:
+        mock_popen.return_value = _popen(stdout=b'{"secrets":[]}\n')
+        assert list(client.iter_list()) == []
+        mock_decode.assert_not_called()
+
+        mock_decode.return_value = ["db-url"]
+        mock_popen.return_value = _popen(stdout=b'{"secrets":[{"name":"db-url"}]}')
+        assert list(client.iter_list()) == ["db-url"]
+        mock_decode.assert_called_once_with(b'{"secrets":[{"name":"db-url"}]}')
+
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_iter_list_raises_typed_error(
+        self, mock_popen: MagicMock, client: Authy
+    ) -> None:
+        body = {"error": {"code": "not_found", "message": "Policy not found: x", "exit_code": 3}}
+        mock_popen.return_value = _popen(stderr=json.dumps(body).encode(), returncode=3)
+        with pytest.raises(SecretNotFound):
+            list(client.iter_list(scope="x"))
+
 
 # ---------------------------------------------------------------------------
 # auth errors
@@ -246,31 +593,28 @@ class TestList:
 
 class TestAuthErrors:
     @patch("authy_secrets.client.subprocess.run")
-    def test_auth_failed_raises(self, mock_run: MagicMock) -> None:
+    def test_auth_failed_raises(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_error(
             "auth_failed", "Authentication failed: bad passphrase", 2
         )
-        client = Authy(binary="/bin/authy")
         with pytest.raises(AuthFailed) as exc_info:
             client.get("db-url")
         assert exc_info.value.exit_code == 2
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_policy_denied_raises(self, mock_run: MagicMock) -> None:
+    def test_policy_denied_raises(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_error(
             "access_denied", "Access denied: secret 'x' not allowed by scope 'y'", 4
         )
-        client = Authy(binary="/bin/authy")
         with pytest.raises(PolicyDenied) as exc_info:
             client.get("x")
         assert exc_info.value.exit_code == 4
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_vault_not_found_raises(self, mock_run: MagicMock) -> None:
+    def test_vault_not_found_raises(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _json_error(
             "vault_not_initialized", "Vault not initialized. Run `authy init` first.", 7
         )
-        client = Authy(binary="/bin/authy")
         with pytest.raises(VaultNotFound) as exc_info:
             client.get("db-url")
         assert exc_info.value.exit_code == 7
@@ -312,6 +656,58 @@ class TestCredentialsEnv:
         assert call_env["AUTHY_KEYFILE"] == "/path/to/key"
 
 
+    @patch("authy_secrets.client.subprocess.run")
+    def test_env_built_once_per_client(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = _json_stdout({"secrets": []})
+        client = Authy(binary="/bin/authy", passphrase="s3cret")
+        client.list()
+        client.list()
+
+        first, second = mock_run.call_args_list
+        assert first[1]["env"] is second[1]["env"]
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_env_inherited_without_credentials(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _json_stdout({"secrets": []})
+        client.list()
+        assert mock_run.call_args[1]["env"] is None
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_run_uses_client_env(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+        client = Authy(binary="/bin/authy", keyfile="/path/to/key")
+        client.run(["env"], scope="deploy")
+
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["/bin/authy", "run", "--scope", "deploy", "--", "env"]
+        assert kwargs["env"] is client._env
+
+
+# ---------------------------------------------------------------------------
+# sessions
+# ---------------------------------------------------------------------------
+
+class TestCreateSession:
+    @patch("authy_secrets.client.subprocess.run")
+    def test_create_session_returns_token(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _json_stdout({
+            "token": "authy_v1.abc",
+            "session_id": "a1b2c3",
+            "scope": "deploy",
+            "run_only": False,
+            "expires": "2025-01-01T01:00:00Z",
+        })
+        assert client.create_session("deploy", ttl="30m", label="ci") == "authy_v1.abc"
+        assert mock_run.call_args[0][0] == [
+            "/bin/authy", "--json", "session", "create",
+            "--scope", "deploy", "--ttl", "30m", "--label", "ci",
+        ]
+
+
 # ---------------------------------------------------------------------------
 # context manager
 # ---------------------------------------------------------------------------
@@ -331,22 +727,282 @@ class TestContextManager:
         assert val == "v"
 
 
+# ---------------------------------------------------------------------------
+# cache=True
+# ---------------------------------------------------------------------------
+
+def _get_stdout(value: str) -> subprocess.CompletedProcess:
+    return _json_stdout({
+        "name": "x",
+        "value": value,
+        "version": 1,
+        "created": "2025-01-01T00:00:00Z",
+        "modified": "2025-01-01T00:00:00Z",
+    })
+
+
+class TestCache:
+    @patch("authy_secrets.client.subprocess.run")
+    def test_repeated_get_runs_once(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = _get_stdout("v")
+        client = Authy(binary="/bin/authy", cache=True)
+        assert client.get("x") == "v"
+        assert client.get("x") == "v"
+        assert mock_run.call_count == 1
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_not_cached_by_default(self, mock_run: MagicMock, client: Authy) -> None:
+        mock_run.return_value = _get_stdout("v")
+        client.get("x")
+        client.get("x")
+        assert mock_run.call_count == 2
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_store_invalidates(self, mock_run: MagicMock) -> None:
+        mock_run.side_effect = [_get_stdout("old"), _completed(), _get_stdout("new")]
+        client = Authy(binary="/bin/authy", cache=True)
+        assert client.get("x") == "old"
+        client.store("x", "new", force=True)
+        assert client.get("x") == "new"
+        assert mock_run.call_count == 3
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_exit_clears(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = _get_stdout("v")
+        with Authy(binary="/bin/authy", cache=True) as client:
+            client.get("x")
+        client.get("x")
+        assert mock_run.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# persistent (authy serve --mcp) mode
+# ---------------------------------------------------------------------------
+
+class TestPersistent:
+    @patch("authy_secrets.client.subprocess.run")
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_calls_share_one_server(
+        self, mock_popen: MagicMock, mock_run: MagicMock
+    ) -> None:
+        proc = _mcp_process(
+            _tool_text("postgres://localhost/mydb"),
+            _tool_text('["db-url"]'),
+        )
+        mock_popen.return_value = proc
+        with Authy(binary="/bin/authy", keyfile="/k", persistent=True) as client:
+            assert client.get("db-url") == "postgres://localhost/mydb"
+            assert client.list() == ["db-url"]
+
+        mock_run.assert_not_called()
+        assert mock_popen.call_count == 1
+        assert mock_popen.call_args[0][0] == ["/bin/authy", "serve", "--mcp"]
+        assert mock_popen.call_args[1]["env"]["AUTHY_KEYFILE"] == "/k"
+        assert "close_fds" not in mock_popen.call_args[1]
+        sent = [json.loads(c[0][0]) for c in proc.stdin.write.call_args_list]
+        assert [m["method"] for m in sent] == [
+            "initialize", "notifications/initialized", "tools/call", "tools/call"
+        ]
+        assert sent[2]["params"] == {
+            "name": "get_secret", "arguments": {"name": "db-url"}
+        }
+        proc.stdin.close.assert_called_once()
+        proc.wait.assert_called_once()
+
+    @patch("authy_secrets.client.subprocess.run")
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_started_lazily_without_context_manager(
+        self, mock_popen: MagicMock, mock_run: MagicMock
+    ) -> None:
+        proc = _mcp_process(_tool_text("v1"), _tool_text("v2"))
+        mock_popen.return_value = proc
+        client = Authy(binary="/bin/authy", persistent=True)
+        mock_popen.assert_not_called()
+
+        assert client.get("a") == "v1"
+        assert client.get("b") == "v2"
+        assert mock_popen.call_count == 1
+        mock_run.assert_not_called()
+
+        client.close()
+        proc.stdin.close.assert_called_once()
+        proc.wait.assert_called_once()
+
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_close_terminates_hung_server(self, mock_popen: MagicMock) -> None:
+        proc = _mcp_process()
+        proc.wait.side_effect = [subprocess.TimeoutExpired("authy", 5.0), 0]
+        mock_popen.return_value = proc
+        with Authy(binary="/bin/authy", persistent=True):
+            pass
+        proc.terminate.assert_called_once()
+        proc.kill.assert_not_called()
+
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_dead_server_is_restarted(self, mock_popen: MagicMock) -> None:
+        first = _mcp_process()
+        second = _mcp_process(_tool_text("v"))
+        mock_popen.side_effect = [first, second]
+        with Authy(binary="/bin/authy", persistent=True) as client:
+            first.poll.return_value = 1
+            assert client.get("x") == "v"
+        assert mock_popen.call_count == 2
+        first.wait.assert_called()
+
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_broken_pipe_raises_and_restarts(self, mock_popen: MagicMock) -> None:
+        first = _mcp_process()
+        second = _mcp_process(_tool_text("v"))
+        mock_popen.side_effect = [first, second]
+        with Authy(binary="/bin/authy", persistent=True) as client:
+            # The server exits between the liveness check and the write.
+            first.stdin.write.side_effect = BrokenPipeError
+            with pytest.raises(AuthyError, match="exited unexpectedly"):
+                client.get("x")
+            first.poll.return_value = 1
+            assert client.get("x") == "v"
+        assert mock_popen.call_count == 2
+
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_tool_error_maps_to_typed_exception(self, mock_popen: MagicMock) -> None:
+        mock_popen.return_value = _mcp_process(
+            _tool_text("Secret not found: db-url", is_error=True),
+            _tool_text("Secret not found: db-url", is_error=True),
+        )
+        with Authy(binary="/bin/authy", persistent=True) as client:
+            with pytest.raises(SecretNotFound) as exc_info:
+                client.get("db-url")
+            assert exc_info.value.exit_code == 3
+            assert client.get_or_none("db-url") is None
+
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_remove_missing_raises(self, mock_popen: MagicMock) -> None:
+        mock_popen.return_value = _mcp_process(_tool_text("Secret 'x' not found"))
+        with Authy(binary="/bin/authy", persistent=True) as client:
+            with pytest.raises(SecretNotFound):
+                client.remove("x")
+
+    @patch("authy_secrets.client.subprocess.run")
+    @patch("authy_secrets.client.subprocess.Popen")
+    def test_not_persistent_by_default(
+        self, mock_popen: MagicMock, mock_run: MagicMock
+    ) -> None:
+        mock_run.return_value = _json_stdout({"secrets": []})
+        with Authy(binary="/bin/authy") as client:
+            client.list()
+        mock_popen.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# decoders without the optional fast dependencies
+# ---------------------------------------------------------------------------
+
+def _load_client_without(monkeypatch: pytest.MonkeyPatch, *blocked: str) -> ModuleType:
+    # Load a private copy of the client module, leaving the imported one
+    # (and the classes other tests hold) untouched.
+    for name in blocked:
+        monkeypatch.setitem(sys.modules, name, None)
+    import authy_secrets.client as real
+
+    spec = importlib.util.spec_from_file_location(
+        "authy_secrets._client_fallback", real.__file__
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("blocked", [("msgspec",), ("msgspec", "orjson")])
+class TestFallbackDecoders:
+    def test_decoders_skip_msgspec(
+        self, monkeypatch: pytest.MonkeyPatch, blocked: tuple
+    ) -> None:
+        module = _load_client_without(monkeypatch, *blocked)
+        assert module.msgspec is None
+        assert not hasattr(module, "_GetResponse")
+        if "orjson" in blocked:
+            assert module._loads is json.loads
+
+    def test_decode_value(self, monkeypatch: pytest.MonkeyPatch, blocked: tuple) -> None:
+        module = _load_client_without(monkeypatch, *blocked)
+        raw = json.dumps(
+            {"name": "db-url", "value": "postgres://localhost/db", "version": 2}
+        ).encode()
+        assert module._decode_value(raw) == "postgres://localhost/db"
+
+    def test_decode_names(self, monkeypatch: pytest.MonkeyPatch, blocked: tuple) -> None:
+        module = _load_client_without(monkeypatch, *blocked)
+        raw = json.dumps({"secrets": [
+            {"name": "db-url", "version": 1},
+            {"name": "api-key", "version": 3},
+        ]}).encode()
+        assert module._decode_names(raw) == ["db-url", "api-key"]
+        assert module._decode_list(raw) == ["db-url", "api-key"]
+        assert module._decode_list(b'{"secrets":[]}\n') == []
+
+    def test_decode_values(self, monkeypatch: pytest.MonkeyPatch, blocked: tuple) -> None:
+        module = _load_client_without(monkeypatch, *blocked)
+        raw = json.dumps([
+            {"name": "db-url", "value": "postgres://localhost/db"},
+            {"name": "api-key", "value": "sk-123"},
+        ]).encode()
+        assert module._decode_values(raw) == {
+            "db-url": "postgres://localhost/db",
+            "api-key": "sk-123",
+        }
+
+    def test_get_through_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, blocked: tuple
+    ) -> None:
+        module = _load_client_without(monkeypatch, *blocked)
+        with patch.object(module.subprocess, "run") as mock_run:
+            mock_run.return_value = _get_stdout("sk-123")
+            assert module.Authy(binary="/bin/authy").get("api-key") == "sk-123"
+
+
 # ---------------------------------------------------------------------------
 # unparseable stderr
 # ---------------------------------------------------------------------------
 
 class TestUnparseableError:
     @patch("authy_secrets.client.subprocess.run")
-    def test_unparseable_stderr_raises_base_error(self, mock_run: MagicMock) -> None:
+    def test_unparseable_stderr_raises_base_error(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
         mock_run.return_value = _completed(
-            stderr="something went wrong", returncode=1
+            stderr=b"something went wrong", returncode=1
         )
-        client = Authy(binary="/bin/authy")
         with pytest.raises(AuthyError) as exc_info:
             client.get("x")
         assert exc_info.value.exit_code == 1
         assert "something went wrong" in exc_info.value.message
 
+    @patch("authy_secrets.client.subprocess.run")
+    def test_error_message_escapes_decoded(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        mock_run.return_value = _json_error(
+            "access_denied", 'Access denied: secret "x" not allowed — scope y', 4
+        )
+        with pytest.raises(PolicyDenied) as exc_info:
+            client.get("x")
+        assert exc_info.value.error_code == "access_denied"
+        assert exc_info.value.message == 'Access denied: secret "x" not allowed — scope y'
+
+    @patch("authy_secrets.client.subprocess.run")
+    def test_json_error_after_progress_lines(
+        self, mock_run: MagicMock, client: Authy
+    ) -> None:
+        body = {"error": {"code": "auth_failed", "message": "Authentication failed: x",
+                          "exit_code": 2}}
+        mock_run.return_value = _completed(
+            stderr=b"Skipping 'a' (already exists)\n" + json.dumps(body).encode() + b"\n",
+            returncode=2,
+        )
+        with pytest.raises(AuthFailed):
+            client.import_dotenv(".env")
+
 
 # ---------------------------------------------------------------------------
 # import_dotenv
@@ -354,17 +1010,15 @@ class TestUnparseableError:
 
 class TestImportDotenv:
     @patch("authy_secrets.client.subprocess.run")
-    def test_import_dotenv(self, mock_run: MagicMock) -> None:
+    def test_import_dotenv(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _completed()
-        client = Authy(binary="/bin/authy")
         client.import_dotenv(".env")
         call_args = mock_run.call_args
         assert call_args[0][0] == ["/bin/authy", "--json", "import", ".env"]
 
     @patch("authy_secrets.client.subprocess.run")
-    def test_import_dotenv_force(self, mock_run: MagicMock) -> None:
+    def test_import_dotenv_force(self, mock_run: MagicMock, client: Authy) -> None:
         mock_run.return_value = _completed()
-        client = Authy(binary="/bin/authy")
         client.import_dotenv(".env", force=True)
         call_args = mock_run.call_args
         assert call_args[0][0] == ["/bin/authy", "--json", "import", ".env", "--force"]
@@ -380,23 +1034,73 @@ class TestIsInitialized:
     def test_returns_true_when_vault_exists(
         self, mock_run: MagicMock, mock_which: MagicMock
     ) -> None:
-        # Any error other than vault_not_initialized means vault exists
-        mock_run.return_value = _json_error("auth_failed", "Authentication failed", 2)
+        mock_run.return_value = _json_stdout({"initialized": True})
         assert Authy.is_initialized() is True
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == ["/bin/authy", "--json", "status"]
+        assert "env" not in mock_run.call_args[1]
 
     @patch("authy_secrets.client.shutil.which", return_value="/bin/authy")
     @patch("authy_secrets.client.subprocess.run")
     def test_returns_false_when_no_vault(
         self, mock_run: MagicMock, mock_which: MagicMock
     ) -> None:
-        mock_run.return_value = _json_error(
-            "vault_not_initialized",
-            "Vault not initialized. Run `authy init` first.",
-            7,
+        mock_run.return_value = _json_stdout({"initialized": False})
+        assert Authy.is_initialized() is False
+
+    @patch("authy_secrets.client.shutil.which", return_value="/bin/authy")
+    @patch("authy_secrets.client.subprocess.run")
+    def test_older_cli_falls_back_to_probe(
+        self, mock_run: MagicMock, mock_which: MagicMock
+    ) -> None:
+        usage_error = _completed(
+            stderr=b"error: unrecognized subcommand 'status'", returncode=2
         )
+        # Any error other than vault_not_initialized means vault exists
+        mock_run.side_effect = [
+            usage_error,
+            _json_error("auth_failed", "Authentication failed", 2),
+        ]
+        assert Authy.is_initialized() is True
+
+        mock_run.side_effect = [
+            usage_error,
+            _json_error(
+                "vault_not_initialized",
+                "Vault not initialized. Run `authy init` first.",
+                7,
+            ),
+        ]
         assert Authy.is_initialized() is False
+        assert mock_run.call_args[0][0] == ["/bin/authy", "--json", "get", "__probe"]
+
+    @patch("authy_secrets.client.shutil.which", return_value="/usr/bin/authy")
+    @patch("authy_secrets.client.subprocess.run")
+    def test_bare_binary_name_resolved(
+        self, mock_run: MagicMock, mock_which: MagicMock
+    ) -> None:
+        mock_run.return_value = _json_stdout({"initialized": True})
+        assert Authy.is_initialized(binary="authy") is True
+        assert mock_run.call_args[0][0][0] == "/usr/bin/authy"
 
     @patch("authy_secrets.client.shutil.which", return_value=None)
     def test_raises_when_binary_not_found(self, mock_which: MagicMock) -> None:
         with pytest.raises(FileNotFoundError):
             Authy.is_initialized()
+
+
+# ---------------------------------------------------------------------------
+# process spawning
+# ---------------------------------------------------------------------------
+
+@pytest.mark.skipif(
+    not getattr(subprocess, "_USE_POSIX_SPAWN", False),
+    reason="subprocess does not use posix_spawn on this platform",
+)
+def test_cli_spawned_with_posix_spawn(tmp_path: Any) -> None:
+    fake = tmp_path / "authy"
+    fake.write_text('#!/bin/sh\necho \'{"secrets": [{"name": "a"}]}\'\n')
+    fake.chmod(0o755)
+    with patch("os.posix_spawn", wraps=os.posix_spawn) as spawn:
+        assert Authy(binary=str(fake)).list() == ["a"]
+    spawn.assert_called_once()
@@ -6,7 +6,6 @@ Skip reason: these tests are automatically skipped if ``authy`` is not found.
 
 from __future__ import annotations
 
-import os
 import shutil
 import tempfile
 
@@ -30,22 +29,35 @@ def check_authy() -> None:
 
 
 @pytest.fixture()
-def isolated_vault(tmp_path):
+def isolated_vault(tmp_path, monkeypatch):
     """Create a temporary HOME so authy init creates a fresh vault."""
-    old_home = os.environ.get("HOME")
-    os.environ["HOME"] = str(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path))
     # Also clear any existing authy env vars
-    for key in ("AUTHY_PASSPHRASE", "AUTHY_KEYFILE", "AUTHY_TOKEN"):
-        os.environ.pop(key, None)
+    for key in ("AUTHY_KEYFILE", "AUTHY_TOKEN"):
+        monkeypatch.delenv(key, raising=False)
     # Set a deterministic passphrase for test vault
-    os.environ["AUTHY_PASSPHRASE"] = "test-passphrase"
-    yield tmp_path
-    # Restore
-    if old_home is not None:
-        os.environ["HOME"] = old_home
-    else:
-        os.environ.pop("HOME", None)
-    os.environ.pop("AUTHY_PASSPHRASE", None)
+    monkeypatch.setenv("AUTHY_PASSPHRASE", "test-passphrase")
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def vault_template(tmp_path_factory):
+    """An initialized ``.authy`` directory, created once per session."""
+    _skip_if_no_authy()
+    home = tmp_path_factory.mktemp("template-home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        for key in ("AUTHY_PASSPHRASE", "AUTHY_KEYFILE", "AUTHY_TOKEN"):
+            mp.delenv(key, raising=False)
+        Authy(passphrase="test-passphrase").init()
+    return home / ".authy"
+
+
+@pytest.fixture()
+def initialized_vault(isolated_vault, vault_template):
+    """A private copy of an initialized vault, without running init again."""
+    shutil.copytree(vault_template, isolated_vault / ".authy")
+    return isolated_vault
 
 
 class TestRoundtrip:
@@ -57,50 +69,74 @@ class TestRoundtrip:
         value = client.get("db-url")
         assert value == "postgres://localhost/testdb"
 
-    def test_store_duplicate_raises(self, isolated_vault) -> None:
+    def test_store_duplicate_raises(self, initialized_vault) -> None:
         client = Authy(passphrase="test-passphrase")
-        client.init()
         client.store("api-key", "sk-first")
 
         with pytest.raises(SecretAlreadyExists):
             client.store("api-key", "sk-second")
 
-    def test_store_force_overwrites(self, isolated_vault) -> None:
+    def test_store_force_overwrites(self, initialized_vault) -> None:
         client = Authy(passphrase="test-passphrase")
-        client.init()
         client.store("api-key", "sk-first")
         client.store("api-key", "sk-second", force=True)
         assert client.get("api-key") == "sk-second"
 
-    def test_remove(self, isolated_vault) -> None:
+    def test_remove(self, initialized_vault) -> None:
         client = Authy(passphrase="test-passphrase")
-        client.init()
         client.store("temp-secret", "value")
         assert client.remove("temp-secret") is True
 
         with pytest.raises(SecretNotFound):
             client.get("temp-secret")
 
-    def test_rotate_bumps_version(self, isolated_vault) -> None:
+    def test_rotate_bumps_version(self, initialized_vault) -> None:
         client = Authy(passphrase="test-passphrase")
-        client.init()
         client.store("rotating-key", "v1")
         version = client.rotate("rotating-key", "v2")
         assert version == 2
         assert client.get("rotating-key") == "v2"
 
-    def test_list(self, isolated_vault) -> None:
+    def test_list(self, initialized_vault) -> None:
         client = Authy(passphrase="test-passphrase")
-        client.init()
         client.store("alpha", "a")
         client.store("beta", "b")
         names = client.list()
         assert "alpha" in names
         assert "beta" in names
 
-    def test_get_or_none_missing(self, isolated_vault) -> None:
+    def test_store_many_get_many_roundtrip(self, initialized_vault) -> None:
+        client = Authy(passphrase="test-passphrase")
+        secrets = {"alpha": "a", "multi-line": 'line "one"\nline two'}
+        client.store_many(secrets)
+        assert client.get_many(["alpha", "multi-line"]) == secrets
+
+        with pytest.raises(SecretAlreadyExists):
+            client.store_many({"alpha": "a2"})
+        assert client.get("alpha") == "a"
+        client.store_many({"alpha": "a2"}, force=True)
+        assert client.get("alpha") == "a2"
+
+    def test_get_many_ignores_project_naming(self, initialized_vault, monkeypatch) -> None:
+        project = initialized_vault / "project"
+        project.mkdir()
+        (project / ".authy.toml").write_text('[authy]\nscope = "none"\nuppercase = true\n')
+        monkeypatch.chdir(project)
+        client = Authy(passphrase="test-passphrase")
+        client.store("db-url", "postgres://db")
+        assert client.get_many(["db-url"]) == {"db-url": "postgres://db"}
+
+    def test_persistent_roundtrip(self, initialized_vault) -> None:
+        with Authy(passphrase="test-passphrase", persistent=True) as client:
+            client.store("api-key", "sk-1")
+            assert client.get("api-key") == "sk-1"
+            assert client.list() == ["api-key"]
+            assert client.remove("api-key") is True
+            with pytest.raises(SecretNotFound):
+                client.get("api-key")
+
+    def test_get_or_none_missing(self, initialized_vault) -> None:
         client = Authy(passphrase="test-passphrase")
-        client.init()
         assert client.get_or_none("nonexistent") is None
 
     def test_is_initialized(self, isolated_vault) -> None:
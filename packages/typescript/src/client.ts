@@ -7,6 +7,7 @@ import type {
   RunOptions,
   RunResult,
   GetResponse,
+  RotateResponse,
   ListResponse,
   JsonErrorResponse,
 } from "./types.js";
@@ -207,7 +208,12 @@ export class Authy {
 
   /** Rotate a secret to a new value. Returns the new version number. */
   async rotate(name: string, value: string): Promise<number> {
-    await this.runCmd(["rotate", name], value);
+    const rotated = (await this.runCmd(["rotate", name], value)) as unknown as
+      Partial<RotateResponse>;
+    if (rotated.version !== undefined) {
+      return rotated.version;
+    }
+    // Older CLIs print nothing on rotate; read the version back.
     const result = (await this.runCmd(["get", name])) as unknown as GetResponse;
     return result.version;
   }
@@ -16,6 +16,7 @@ export type {
   RunOptions,
   RunResult,
   GetResponse,
+  RotateResponse,
   ListResponse,
   SecretListItem,
   JsonErrorResponse,
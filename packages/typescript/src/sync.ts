@@ -7,6 +7,7 @@ import type {
   RunOptions,
   RunResult,
   GetResponse,
+  RotateResponse,
   ListResponse,
   JsonErrorResponse,
 } from "./types.js";
@@ -154,7 +155,12 @@ export class AuthySync {
 
   /** Rotate a secret to a new value. Returns the new version number. */
   rotate(name: string, value: string): number {
-    this.runCmd(["rotate", name], value);
+    const rotated = this.runCmd(["rotate", name], value) as unknown as
+      Partial<RotateResponse>;
+    if (rotated.version !== undefined) {
+      return rotated.version;
+    }
+    // Older CLIs print nothing on rotate; read the version back.
     const result = this.runCmd(["get", name]) as unknown as GetResponse;
     return result.version;
   }
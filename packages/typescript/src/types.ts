@@ -42,6 +42,12 @@ export interface GetResponse {
   modified: string;
 }
 
+/** JSON response from `authy rotate --json`. */
+export interface RotateResponse {
+  name: string;
+  version: number;
+}
+
 /** JSON response from `authy list --json`. */
 export interface ListResponse {
   secrets: SecretListItem[];
@@ -1,3 +1,5 @@
+use std::collections::HashSet;
+
 use serde::Serialize;
 
 use authy::audit;
@@ -23,9 +25,16 @@ pub fn run(
     uppercase_arg: bool,
     replace_dash_arg: Option<char>,
     prefix_arg: Option<String>,
+    names: &[String],
 ) -> Result<()> {
-    // Merge CLI args with project config (scope remains optional for export)
-    let project = ProjectConfig::discover_from_cwd().ok().flatten();
+    // Merge CLI args with project config (scope remains optional for export).
+    // A --names lookup reads secrets by vault name, like `get`, so it ignores
+    // the project config; explicit flags still apply.
+    let project = if names.is_empty() {
+        ProjectConfig::discover_from_cwd().ok().flatten()
+    } else {
+        None
+    };
     let project_config = project.as_ref().map(|(c, _)| c);
 
     let scope = scope_arg
@@ -69,12 +78,18 @@ pub fn run(
         prefix,
     };
 
+    // An empty --names list exports everything; otherwise match vault names
+    // (before any naming transform).
+    let name_set: HashSet<&str> = names.iter().map(String::as_str).collect();
+    let wanted = |name: &str| name_set.is_empty() || name_set.contains(name);
+
     match format {
         "env" => {
             if let Some(ref scope) = scope {
                 let secrets = common::resolve_scoped_secrets(&vault_data, scope, &auth_ctx)?;
                 let mut pairs: Vec<(String, String)> = secrets
                     .iter()
+                    .filter(|(name, _)| wanted(name))
                     .map(|(name, value)| (transform_name(name, &naming), value.clone()))
                     .collect();
                 pairs.sort_by(|a, b| a.0.cmp(&b.0));
@@ -87,6 +102,7 @@ pub fn run(
                 let mut pairs: Vec<(String, &str)> = vault_data
                     .secrets
                     .iter()
+                    .filter(|(name, _)| wanted(name))
                     .map(|(name, entry)| (transform_name(name, &naming), entry.value.as_str()))
                     .collect();
                 pairs.sort_by(|a, b| a.0.cmp(&b.0));
@@ -101,6 +117,7 @@ pub fn run(
                 let secrets = common::resolve_scoped_secrets(&vault_data, scope, &auth_ctx)?;
                 let mut entries: Vec<ExportJsonEntry> = secrets
                     .keys()
+                    .filter(|name| wanted(name))
                     .filter_map(|name| {
                         vault_data.secrets.get(name).map(|entry| ExportJsonEntry {
                             name: transform_name(name, &naming),
@@ -121,6 +138,7 @@ pub fn run(
                 let mut entries: Vec<ExportJsonEntry> = vault_data
                     .secrets
                     .iter()
+                    .filter(|(name, _)| wanted(name))
                     .map(|(name, entry)| ExportJsonEntry {
                         name: transform_name(name, &naming),
                         value: entry.value.clone(),
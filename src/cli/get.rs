@@ -1,10 +1,10 @@
 use authy::audit;
 use authy::auth;
-use crate::cli::json_output::GetResponse;
+use crate::cli::json_output::{GetMissingResponse, GetResponse};
 use authy::error::{AuthyError, Result};
 use authy::vault;
 
-pub fn run(name: &str, scope: Option<&str>, json: bool) -> Result<()> {
+pub fn run(name: &str, scope: Option<&str>, allow_missing: bool, json: bool) -> Result<()> {
     let (key, auth_ctx) = auth::resolve_auth(false)?;
     let vault = vault::load_vault(&key)?;
 
@@ -51,10 +51,25 @@ pub fn run(name: &str, scope: Option<&str>, json: bool) -> Result<()> {
         }
     }
 
-    let entry = vault
-        .secrets
-        .get(name)
-        .ok_or_else(|| AuthyError::SecretNotFound(name.to_string()))?;
+    let entry = match vault.secrets.get(name) {
+        Some(entry) => entry,
+        None if allow_missing => {
+            // A miss is an expected outcome here, not an error
+            if json {
+                let response = GetMissingResponse {
+                    name: name.to_string(),
+                    value: None,
+                };
+                println!(
+                    "{}",
+                    serde_json::to_string(&response)
+                        .map_err(|e| AuthyError::Serialization(e.to_string()))?
+                );
+            }
+            return Ok(());
+        }
+        None => return Err(AuthyError::SecretNotFound(name.to_string())),
+    };
 
     if json {
         let response = GetResponse {
@@ -1,5 +1,11 @@
 use serde::Serialize;
 
+/// JSON response for `authy status --json`.
+#[derive(Serialize)]
+pub struct StatusResponse {
+    pub initialized: bool,
+}
+
 /// JSON response for `authy get --json`.
 #[derive(Serialize)]
 pub struct GetResponse {
@@ -10,6 +16,20 @@ pub struct GetResponse {
     pub modified: String,
 }
 
+/// JSON response for `authy get --allow-missing --json` when the secret does not exist.
+#[derive(Serialize)]
+pub struct GetMissingResponse {
+    pub name: String,
+    pub value: Option<String>,
+}
+
+/// JSON response for `authy rotate --json`.
+#[derive(Serialize)]
+pub struct RotateResponse {
+    pub name: String,
+    pub version: u32,
+}
+
 /// JSON response for `authy list --json`.
 #[derive(Serialize)]
 pub struct ListResponse {
@@ -21,6 +21,7 @@ pub mod rotate;
 pub mod run;
 pub mod serve;
 pub mod session;
+pub mod status;
 pub mod store;
 
 use clap::{Parser, Subcommand, ValueEnum};
@@ -48,6 +49,9 @@ pub enum Commands {
         passphrase: Option<String>,
     },
 
+    /// Show whether a vault is initialized (no authentication required)
+    Status,
+
     /// Store a secret (reads value from stdin)
     Store {
         /// Secret name
@@ -64,6 +68,9 @@ pub enum Commands {
         /// Scope to enforce policy against
         #[arg(long)]
         scope: Option<String>,
+        /// Exit successfully with no value (JSON: null) if the secret does not exist
+        #[arg(long)]
+        allow_missing: bool,
     },
 
     /// List secret names
@@ -188,6 +195,10 @@ pub enum Commands {
         /// Prefix for env var names
         #[arg(long)]
         prefix: Option<String>,
+        /// Only export these secrets (comma-separated vault names); the
+        /// .authy.toml project config is not applied
+        #[arg(long, value_delimiter = ',')]
+        names: Vec<String>,
     },
 
     /// View and verify audit logs
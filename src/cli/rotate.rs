@@ -2,10 +2,11 @@ use std::io::{self, Read};
 
 use authy::audit;
 use authy::auth;
+use crate::cli::json_output::RotateResponse;
 use authy::error::{AuthyError, Result};
 use authy::vault;
 
-pub fn run(name: &str) -> Result<()> {
+pub fn run(name: &str, json: bool) -> Result<()> {
     let (key, auth_ctx) = auth::resolve_auth(true)?;
     let mut vault = vault::load_vault(&key)?;
 
@@ -42,6 +43,18 @@ pub fn run(name: &str) -> Result<()> {
         &audit_key,
     )?;
 
-    eprintln!("Secret '{}' rotated to version {}.", name, version);
+    if json {
+        let response = RotateResponse {
+            name: name.to_string(),
+            version,
+        };
+        println!(
+            "{}",
+            serde_json::to_string(&response)
+                .map_err(|e| AuthyError::Serialization(e.to_string()))?
+        );
+    } else {
+        eprintln!("Secret '{}' rotated to version {}.", name, version);
+    }
     Ok(())
 }
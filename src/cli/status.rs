@@ -0,0 +1,24 @@
+use crate::cli::json_output::StatusResponse;
+use authy::error::{AuthyError, Result};
+use authy::vault;
+
+/// Report whether a vault exists. Never touches credentials or decrypts
+/// the vault, so it is cheap enough for health checks.
+pub fn run(json: bool) -> Result<()> {
+    let initialized = vault::is_initialized();
+
+    if json {
+        let response = StatusResponse { initialized };
+        println!(
+            "{}",
+            serde_json::to_string(&response)
+                .map_err(|e| AuthyError::Serialization(e.to_string()))?
+        );
+    } else if initialized {
+        println!("Vault initialized at {}", vault::vault_path().display());
+    } else {
+        println!("Vault not initialized. Run `authy init` first.");
+    }
+
+    Ok(())
+}
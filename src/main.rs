@@ -15,15 +15,21 @@ fn main() {
             passphrase,
         } => cli::init::run(passphrase.clone(), generate_keyfile.clone()),
 
+        Commands::Status => cli::status::run(json),
+
         Commands::Store { name, force } => cli::store::run(name, *force),
 
-        Commands::Get { name, scope } => cli::get::run(name, scope.as_deref(), json),
+        Commands::Get {
+            name,
+            scope,
+            allow_missing,
+        } => cli::get::run(name, scope.as_deref(), *allow_missing, json),
 
         Commands::List { scope } => cli::list::run(scope.as_deref(), json),
 
         Commands::Remove { name } => cli::remove::run(name),
 
-        Commands::Rotate { name } => cli::rotate::run(name),
+        Commands::Rotate { name } => cli::rotate::run(name, json),
 
         Commands::Policy { command } => cli::policy::run(command, json),
 
@@ -76,7 +82,15 @@ fn main() {
             uppercase,
             replace_dash,
             prefix,
-        } => cli::export::run(format, scope.as_deref(), *uppercase, *replace_dash, prefix.clone()),
+            names,
+        } => cli::export::run(
+            format,
+            scope.as_deref(),
+            *uppercase,
+            *replace_dash,
+            prefix.clone(),
+            names,
+        ),
 
         Commands::Audit { command } => cli::audit::run(command, json),
 
@@ -73,6 +73,67 @@ fn test_export_json_format() {
     }
 }
 
+#[test]
+fn test_export_json_names_filter() {
+    let home = TempDir::new().unwrap();
+    setup(&home);
+
+    let output = authy_cmd(&home)
+        .args(["export", "--format", "json", "--names", "api-key,missing"])
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    let entries = json.as_array().unwrap();
+    assert_eq!(entries.len(), 1);
+    assert_eq!(entries[0]["name"], "api-key");
+    assert_eq!(entries[0]["value"], "sk-123");
+}
+
+#[test]
+fn test_export_names_ignores_project_config() {
+    let home = TempDir::new().unwrap();
+    setup(&home);
+    authy_cmd(&home)
+        .args(["policy", "create", "db-only", "--allow", "db-*"])
+        .assert()
+        .success();
+
+    let project = TempDir::new().unwrap();
+    std::fs::write(
+        project.path().join(".authy.toml"),
+        "[authy]\nscope = \"db-only\"\nuppercase = true\nreplace_dash = \"_\"\n",
+    )
+    .unwrap();
+
+    // Without --names the project scope and naming apply.
+    authy_cmd(&home)
+        .current_dir(project.path())
+        .args(["export", "--format", "env"])
+        .assert()
+        .success()
+        .stdout(predicate::str::contains("DB_HOST=localhost"))
+        .stdout(predicate::str::contains("API_KEY").not());
+
+    // With --names secrets are looked up and reported by vault name.
+    let output = authy_cmd(&home)
+        .current_dir(project.path())
+        .args(["export", "--format", "json", "--names=db-host,api-key"])
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    let names: Vec<&str> = json
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|e| e["name"].as_str().unwrap())
+        .collect();
+    assert_eq!(names, ["api-key", "db-host"]);
+}
+
 #[test]
 fn test_export_with_scope() {
     let home = TempDir::new().unwrap();
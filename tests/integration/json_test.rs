@@ -39,6 +39,31 @@ fn setup(home: &TempDir) {
         .success();
 }
 
+#[test]
+fn test_status_json() {
+    let home = TempDir::new().unwrap();
+
+    let output = authy_cmd(&home)
+        .args(["status", "--json"])
+        .output()
+        .unwrap();
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    assert_eq!(json["initialized"], false);
+
+    setup(&home);
+
+    // No credentials needed to probe
+    let output = authy_cmd(&home)
+        .env_remove("AUTHY_PASSPHRASE")
+        .args(["status", "--json"])
+        .output()
+        .unwrap();
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    assert_eq!(json["initialized"], true);
+}
+
 #[test]
 fn test_get_json() {
     let home = TempDir::new().unwrap();
@@ -58,6 +83,48 @@ fn test_get_json() {
     assert!(json["modified"].is_string());
 }
 
+#[test]
+fn test_get_allow_missing_json() {
+    let home = TempDir::new().unwrap();
+    setup(&home);
+
+    let output = authy_cmd(&home)
+        .args(["get", "nope", "--allow-missing", "--json"])
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    assert_eq!(json["name"], "nope");
+    assert!(json["value"].is_null());
+
+    // Existing secrets are returned as usual
+    let output = authy_cmd(&home)
+        .args(["get", "api-key", "--allow-missing", "--json"])
+        .output()
+        .unwrap();
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    assert_eq!(json["value"], "sk-test-123");
+}
+
+#[test]
+fn test_rotate_json() {
+    let home = TempDir::new().unwrap();
+    setup(&home);
+
+    let output = authy_cmd(&home)
+        .args(["rotate", "api-key", "--json"])
+        .write_stdin("sk-test-456")
+        .output()
+        .unwrap();
+
+    assert!(output.status.success());
+    let json: serde_json::Value = serde_json::from_slice(&output.stdout).unwrap();
+    assert_eq!(json["name"], "api-key");
+    assert_eq!(json["version"], 2);
+}
+
 #[test]
 fn test_list_json() {
     let home = TempDir::new().unwrap();